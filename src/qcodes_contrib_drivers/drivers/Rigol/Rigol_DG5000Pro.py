@@ -1,4 +1,4 @@
-from typing import TYPE_CHECKING, Union
+from typing import TYPE_CHECKING, Any, Optional, Sequence, Union
 
 from qcodes.instrument import VisaInstrument, VisaInstrumentKWArgs, InstrumentChannel, InstrumentBaseKWArgs, Instrument
 from qcodes.parameters import Parameter
@@ -6,210 +6,227 @@ from qcodes.parameters import create_on_off_val_mapping
 from qcodes.validators import Enum, Ints, MultiType, Numbers, Strings
 
 if TYPE_CHECKING:
+    from qcodes.parameters import ParameterBase
     from typing_extensions import Unpack
 
+_MODEL_CHANNELS = {
+    "DG5258 Pro": 8,
+    "DG5358 Pro": 8,
+    "DG5508 Pro": 8,
+    "DG5254 Pro": 4,
+    "DG5354 Pro": 4,
+    "DG5504 Pro": 4,
+    "DG5252 Pro": 2,
+    "DG5352 Pro": 2,
+    "DG5502 Pro": 2,
+}
+"""Number of channels of each model of the Rigol DG5000 Pro series"""
 
-class RigolDG5000ProChannel(InstrumentChannel):
 
-    def __init__(
-            self,
-            parent: Instrument,
-            name: str,
-            channel: int,
-            **kwargs: "Unpack[InstrumentBaseKWArgs]",
-    ) -> None:
-        super().__init__(parent, name, **kwargs)
-        self.model = self._parent.model
-        self.channel = channel
+_ON_OFF_01 = create_on_off_val_mapping(on_val=1, off_val=0)
+"""Shared on/off val_mapping; qcodes treats these dicts as read-only data"""
 
-        # 3.10 :OUTPut Commands
 
-        self.output_debounce: Parameter = self.add_parameter(
-            "output_debounce",
-            get_cmd=f":OUTPut{channel}:DEBounce:STATe?",
-            set_cmd=f":OUTPut{channel}:DEBounce {{:d}}",
-            val_mapping=create_on_off_val_mapping(on_val=1, off_val=0),
-        )
-        """on/off status of the debounce function for the specified channel"""
-
-        self.output_idle: Parameter = self.add_parameter(
-            "output_idle",
-            get_cmd=f":OUTPut{channel}:IDLE?",
-            set_cmd=f":OUTPut{channel}:IDLE {{}}",
-            vals=MultiType(
-                Ints(0, 65535),
-                Enum("FPT", "TOP", "CENT", "BOTT")
-            ),
-            get_parser=lambda x: int(x) if x.isdigit() else x,
-        )
-        """Idle level position of the burst mode for the specified channel"""
-
-        self.output_load: Parameter = self.add_parameter(
-            "output_load",
-            get_cmd=f":OUTPut{channel}:LOAD?",
-            set_cmd=f":OUTPut{channel}:LOAD {{}}",
-            vals=MultiType(
-                Ints(1, 10000),  # Ohms
-                Enum("INF", "MIN", "MAX", "DEF")),
-            get_parser=float
-        )
-        """Output impedance for the specified channel"""
+def _int_or_str(x: str) -> Union[int, str]:
+    """Parses replies that are either an integer or a level keyword (e.g. "TOP")"""
+    return int(x) if x.isdigit() else x
 
-        self.output_polarity: Parameter = self.add_parameter(
-            "output_polarity",
-            get_cmd=f":OUTPut{channel}:POLarity?",
-            set_cmd=f":OUTPut{channel}:POLarity {{}}",
-            val_mapping={"normal": "NORM ", "inverted": "INV "}
-        )
-        """Output polarity for the specified channel"""
-
-        self.output_skew_time: Parameter = self.add_parameter(
-            "output_skew_time",
-            get_cmd=f":OUTPut{channel}:SKEW:TIME?",
-            set_cmd=f":OUTPut{channel}:SKEW:TIME {{}}",
-            vals=MultiType(
-                Numbers(-200e-9, 200e-9),
-                Enum("MIN", "MAX", "DEF")
-            ),
-            get_parser=float
-        )
-        """Channel-to-channel skew (relative timing of the analog output)"""
 
-        self.output_state: Parameter = self.add_parameter(
-            "output_state",
-            get_cmd=f":OUTPut{channel}:STATe?",
-            set_cmd=f":OUTPut{channel}:STATe {{:d}}",
-            val_mapping=create_on_off_val_mapping(on_val=1, off_val=0),
-        )
-        """Output on/off status for the specified channel"""
-
-        self.output_sync: Parameter = self.add_parameter(
-            "output_sync",
-            get_cmd=f":OUTPut{channel}:SYNC?",
-            set_cmd=f":OUTPut{channel}:SYNC {{:d}}",
-            val_mapping=create_on_off_val_mapping(on_val=1, off_val=0),
-        )
-        """Output on/off state of the sync signal"""
-
-        self.output_sync_mode: Parameter = self.add_parameter(
-            "output_sync_mode",
-            get_cmd=f":OUTPut{channel}:SYNC:MODE?",
-            set_cmd=f":OUTPut{channel}:SYNC:MODE {{}}",
-            val_mapping={"normal": "NORM", "marker": "MARK"},
-            get_parser=str.strip
-        )
-        """Frequency mark function for the specified channel"""
-
-        self.output_sync_polarity: Parameter = self.add_parameter(
-            "output_sync_polarity",
-            get_cmd=f":OUTPut{channel}:SYNC:POLarity?",
-            set_cmd=f":OUTPut{channel}:SYNC:POLarity? {{}}",
-            val_mapping={"normal": "NORM", "inverted": "INV"},
-            get_parser=str.strip
-        )
-        """Polarity of sync signal for the specified channel"""
+def _fmt_num(v: Any) -> Any:
+    """
+    Normalizes numeric set values (float, Decimal, numpy scalars, numeric
+    strings) to a compact ASCII form; keywords such as "MIN" pass through.
+    """
+    try:
+        return format(float(v), ".9g")
+    except (TypeError, ValueError):
+        return v
 
-        self.output_trigger: Parameter = self.add_parameter(
-            "output_trigger",
-            get_cmd=f":OUTPut{channel}:TRIGger?",
-            set_cmd=f":OUTPut{channel}:TRIGger {{}}",
-            val_mapping=create_on_off_val_mapping(on_val=1, off_val=0),
-        )
-        """Trigger on/off state for Sweep or Burst mode"""
 
-        self.output_trigger_slope: Parameter = self.add_parameter(
-            "output_trigger_slope",
-            get_cmd=f":OUTPut{channel}:TRIGger:SLOPe?",
-            set_cmd=f":OUTPut{channel}:TRIGger:SLOPe? {{}}",
-            val_mapping={"positive": "POS", "negative": "NEG"},
-        )
-        """Slope of the trigger output signal for the specified channel"""
+class RigolDG5000ProChannel(InstrumentChannel):
 
-        # 3.12 :SOURce Commands
+    _PARAM_SPECS: tuple[tuple[str, str, str, dict, Optional[str]], ...] = (
+        # (name, get_cmd template, set_cmd template, extra kwargs, docstring)
 
-        self.source_am_depth: Parameter = self.add_parameter(
-            "source_am_depth",
-            get_cmd=f":SOURce{channel}:AM:DEPTh?",
-            set_cmd=f":SOURce{channel}:AM:DEPTh {{}}",
-            vals=MultiType(
-                Ints(0, 120),
-                Enum("MIN", "MAX")
-            ),
-            get_parser=float
-        )
-        """AM modulation depth for the specified channel"""
+        # 3.10 :OUTPut Commands
+        ("output_debounce",
+         ":OUTPut{ch}:DEBounce:STATe?", ":OUTPut{ch}:DEBounce {{:d}}",
+         dict(val_mapping=_ON_OFF_01),
+         "on/off status of the debounce function for the specified channel"),
+        ("output_idle",
+         ":OUTPut{ch}:IDLE?", ":OUTPut{ch}:IDLE {{}}",
+         dict(vals=MultiType(
+                  Ints(0, 65535),
+                  Enum("FPT", "TOP", "CENT", "BOTT")
+              ),
+              get_parser=_int_or_str),
+         "Idle level position of the burst mode for the specified channel"),
+        ("output_load",
+         ":OUTPut{ch}:LOAD?", ":OUTPut{ch}:LOAD {{}}",
+         dict(vals=MultiType(
+                  Ints(1, 10000),  # Ohms
+                  Enum("INF", "MIN", "MAX", "DEF")),
+              get_parser=float),
+         "Output impedance for the specified channel"),
+        ("output_polarity",
+         ":OUTPut{ch}:POLarity?", ":OUTPut{ch}:POLarity {{}}",
+         dict(val_mapping={"normal": "NORM ", "inverted": "INV "}),
+         "Output polarity for the specified channel"),
+        ("output_skew_time",
+         ":OUTPut{ch}:SKEW:TIME?", ":OUTPut{ch}:SKEW:TIME {{}}",
+         dict(vals=MultiType(
+                  Numbers(-200e-9, 200e-9),
+                  Enum("MIN", "MAX", "DEF")
+              ),
+              get_parser=float,
+              set_parser=_fmt_num),
+         "Channel-to-channel skew (relative timing of the analog output)"),
+        ("output_state",
+         ":OUTPut{ch}:STATe?", ":OUTPut{ch}:STATe {{:d}}",
+         dict(val_mapping=_ON_OFF_01),
+         "Output on/off status for the specified channel"),
+        ("output_sync",
+         ":OUTPut{ch}:SYNC?", ":OUTPut{ch}:SYNC {{:d}}",
+         dict(val_mapping=_ON_OFF_01),
+         "Output on/off state of the sync signal"),
+        ("output_sync_mode",
+         ":OUTPut{ch}:SYNC:MODE?", ":OUTPut{ch}:SYNC:MODE {{}}",
+         dict(val_mapping={"normal": "NORM", "marker": "MARK"},
+              get_parser=str.strip),
+         "Frequency mark function for the specified channel"),
+        ("output_sync_polarity",
+         ":OUTPut{ch}:SYNC:POLarity?", ":OUTPut{ch}:SYNC:POLarity? {{}}",
+         dict(val_mapping={"normal": "NORM", "inverted": "INV"},
+              get_parser=str.strip),
+         "Polarity of sync signal for the specified channel"),
+        ("output_trigger",
+         ":OUTPut{ch}:TRIGger?", ":OUTPut{ch}:TRIGger {{}}",
+         dict(val_mapping=_ON_OFF_01),
+         "Trigger on/off state for Sweep or Burst mode"),
+        ("output_trigger_slope",
+         ":OUTPut{ch}:TRIGger:SLOPe?", ":OUTPut{ch}:TRIGger:SLOPe? {{}}",
+         dict(val_mapping={"positive": "POS", "negative": "NEG"}),
+         "Slope of the trigger output signal for the specified channel"),
 
-        self.source_am_dssc: Parameter = self.add_parameter(
-            "source_am_dssc",
-            get_cmd=f":SOURce{channel}:AM:DSSC?",
-            set_cmd=f":SOURce{channel}:AM:DSSC {{}}",
-            val_mapping=create_on_off_val_mapping(on_val=1, off_val=0),
-        )
-        """On/off status of the AM DSSC function for the specified channel"""
-
-        self.source_am_frequency: Parameter = self.add_parameter(
-            "source_am_frequency",
-            get_cmd=f":SOURce{channel}:AM:INTernal:FREQuency?",
-            set_cmd=f":SOURce{channel}:AM:INTernal:FREQuency {{}}",
-            vals=MultiType(
-                Numbers(2e-3, 1e6),
-                Enum("MIN", "MAX", "DEF")
-            )
-        )
+        # 3.12 :SOURce Commands
+        ("source_am_depth",
+         ":SOURce{ch}:AM:DEPTh?", ":SOURce{ch}:AM:DEPTh {{}}",
+         dict(vals=MultiType(
+                  Ints(0, 120),
+                  Enum("MIN", "MAX")
+              ),
+              get_parser=float),
+         "AM modulation depth for the specified channel"),
+        ("source_am_dssc",
+         ":SOURce{ch}:AM:DSSC?", ":SOURce{ch}:AM:DSSC {{}}",
+         dict(val_mapping=_ON_OFF_01),
+         "On/off status of the AM DSSC function for the specified channel"),
+        ("source_am_frequency",
+         ":SOURce{ch}:AM:INTernal:FREQuency?", ":SOURce{ch}:AM:INTernal:FREQuency {{}}",
+         dict(vals=MultiType(
+                  Numbers(2e-3, 1e6),
+                  Enum("MIN", "MAX", "DEF")
+              ),
+              set_parser=_fmt_num),
+         None),
 
         # 3.14 :TRIGer Commands
+        ("trigger_count",
+         ":TRIGger{ch}:COUNt?", ":TRIGger{ch}:COUNt {{}}",
+         dict(vals=MultiType(
+                  Ints(1, 1000000),
+                  Enum("MIN", "MAX", "DEF")
+              ),
+              get_parser=_int_or_str),
+         "Trigger count for the specified channel"),
+        ("trigger_delay",
+         ":TRIGger{ch}:DELay?", ":TRIGger{ch}:DElay {{}}",
+         dict(vals=MultiType(
+                  Numbers(0, 85),
+                  Enum("MIN", "MAX", "DEF")
+              ),
+              get_parser=float,
+              set_parser=_fmt_num),
+         "Trigger delay for the specified channel"),
+        ("trigger_slope",
+         ":TRIGger{ch}:SLOPe?", ":TRIGger{ch}:SLOPe {{}}",
+         dict(val_mapping={"positive": "POS", "negative": "NEG"}),
+         "Edge type of the external trigger signal for the specified channel"),
+        ("trigger_source",
+         ":TRIGger{ch}:SOURce?", ":TRIGger{ch}:SOURce {{}}",
+         dict(val_mapping={"immediate": "IMM", "external": "EXT", "bus": "BUS", "timer": "TIM"}),
+         "Trigger type for the specified channel"),
+        ("trigger_timer",
+         ":TRIGger{ch}:TIMer?", ":TRIGger{ch}:TIMer {{}}",
+         dict(vals=MultiType(
+                  Numbers(1e-6, 8000),
+                  Enum("MIN", "MAX")
+              ),
+              get_parser=float,
+              set_parser=_fmt_num),
+         "Trigger timer for the specified channel"),
+    )
+    """Declarative table of the channel parameters; the SCPI command templates
+    are formatted with the channel number once per channel in ``__init__``."""
 
-        self.trigger_count: Parameter = self.add_parameter(
-            "trigger_count",
-            get_cmd=f":TRIGger{channel}:COUNt?",
-            set_cmd=f":TRIGger{channel}:COUNt {{}}",
-            vals=MultiType(
-                Ints(1, 1000000),
-                Enum("MIN", "MAX", "DEF")
-            ),
-            get_parser=lambda x: int(x) if x.isdigit() else x,
-        )
-        """Trigger count for the specified channel"""
-
-        self.trigger_delay: Parameter = self.add_parameter(
-            "trigger_delay",
-            get_cmd=f":TRIGger{channel}:DELay?",
-            set_cmd=f":TRIGger{channel}:DElay {{}}",
-            vals=MultiType(
-                Numbers(0, 85),
-                Enum("MIN", "MAX", "DEF")
-            ),
-            get_parser=float
-        )
-        """Trigger delay for the specified channel"""
+    def __init__(
+            self,
+            parent: Instrument,
+            name: str,
+            channel: int,
+            **kwargs: "Unpack[InstrumentBaseKWArgs]",
+    ) -> None:
+        self._scpi_get_cmds: dict[str, str] = {}
+        """SCPI query string of each parameter, used for batched snapshot updates"""
+        self._scpi_set_cmds: dict[str, str] = {}
+        """SCPI set command template of each parameter"""
 
-        self.trigger_slope: Parameter = self.add_parameter(
-            "trigger_slope",
-            get_cmd=f":TRIGger{channel}:SLOPe?",
-            set_cmd=f":TRIGger{channel}:SLOPe {{}}",
-            val_mapping={"positive": "POS", "negative": "NEG"},
-        )
-        """Edge type of the external trigger signal for the specified channel"""
+        super().__init__(parent, name, **kwargs)
+        self.model = self._parent.model
+        self.channel = channel
+        for name, get_cmd, set_cmd, extra_kwargs, docstring in self._PARAM_SPECS:
+            self.add_parameter(
+                name,
+                get_cmd=get_cmd.format(ch=channel),
+                set_cmd=set_cmd.format(ch=channel),
+                docstring=docstring,
+                **extra_kwargs,
+            )
 
-        self.trigger_source: Parameter = self.add_parameter(
-            "trigger_source",
-            get_cmd=f":TRIGger{channel}:SOURce?",
-            set_cmd=f":TRIGger{channel}:SOURce {{}}",
-            val_mapping={"immediate": "IMM", "external": "EXT", "bus": "BUS", "timer": "TIM"},
-        )
-        """Trigger type for the specified channel"""
-
-        self.trigger_timer: Parameter = self.add_parameter(
-            "trigger_timer",
-            get_cmd=f":TRIGger{channel}:TIMer?",
-            set_cmd=f":TRIGger{channel}:TIMer {{}}",
-            vals=MultiType(
-                Numbers(1e-6, 8000),
-                Enum("MIN", "MAX")
-            ),
-            get_parser=float
-        )
-        """Trigger timer for the specified channel"""
+    def add_parameter(
+            self,
+            name: str,
+            parameter_class: Optional[type] = None,
+            **kwargs: Any,
+    ) -> Any:
+        # Record plain-string SCPI commands so that snapshot_base can batch
+        # all queries of a channel into a single VISA round-trip.
+        if isinstance(kwargs.get("get_cmd"), str):
+            self._scpi_get_cmds[name] = kwargs["get_cmd"]
+        if isinstance(kwargs.get("set_cmd"), str):
+            self._scpi_set_cmds[name] = kwargs["set_cmd"]
+        return super().add_parameter(name, parameter_class, **kwargs)
+
+    def snapshot_base(
+            self,
+            update: Optional[bool] = False,
+            params_to_skip_update: Optional[Sequence[str]] = None,
+    ) -> dict[Any, Any]:
+        """
+        Snapshot of the channel.
+
+        When an update is requested, all parameters backed by a plain SCPI
+        query are refreshed with a single batched query instead of one VISA
+        round-trip per parameter.
+        """
+        if update and self._scpi_get_cmds:
+            names = list(self._scpi_get_cmds)
+            replies = self.root_instrument._batched_ask(
+                [self._scpi_get_cmds[name] for name in names])
+            for name, raw in zip(names, replies):
+                self.parameters[name].cache._set_from_raw_value(raw)
+            params_to_skip_update = tuple(set(params_to_skip_update or ()) | set(names))
+        return super().snapshot_base(update=update, params_to_skip_update=params_to_skip_update)
 
     def trigger(self) -> None:
         """Generate trigger event for the specified channel"""
@@ -228,7 +245,10 @@ class RigolDG5000ProChannel(InstrumentChannel):
             phase:
         """
         # TODO : Add validators to the input
-        self.write(f":SOURce{self.channel}:APPLy:RAMP {frequency},{amplitude},{offset},{phase}")
+        # %.9g keeps the command compact and deterministic (float.__str__ can
+        # emit verbose representations that cost bytes on the wire)
+        self.write(":SOURce%d:APPLy:RAMP %.9g,%.9g,%.9g,%.9g"
+                   % (self.channel, frequency, amplitude, offset, phase))
 
 
 class RigolDG5000Pro(VisaInstrument):
@@ -248,22 +268,11 @@ class RigolDG5000Pro(VisaInstrument):
 
         self.model = self.get_idn()["model"]
 
-        models = ["DG5258 Pro",
-                  "DG5358 Pro",
-                  "DG5508 Pro",
-                  "DG5254 Pro",
-                  "DG5354 Pro",
-                  "DG5504 Pro",
-                  "DG5252 Pro",
-                  "DG5352 Pro",
-                  "DG5502 Pro"]
-
-        if self.model in models:
-            i = models.index(self.model)
-            n_o_ch = [8, 8, 8, 4, 4, 4, 2, 2, 2][i]
-        elif self.model is None:
+        if self.model is None:
             raise KeyError("Could not determine model")
-        else:
+
+        n_o_ch = _MODEL_CHANNELS.get(self.model)
+        if n_o_ch is None:
             raise KeyError("Model code " + self.model + " is not recognized")
 
         self.ch = []
@@ -296,7 +305,7 @@ class RigolDG5000Pro(VisaInstrument):
             "display_focus",
             get_cmd=":DISPlay:FOCus?",
             set_cmd=":DISPlay:FOCus {}",
-            val_mapping={1: "CH1", 2: "CH2", 3: "CH3", 4: "CH4", 5: "CH5", 6: "CH6", 7: "CH7", 8: "CH8"},
+            val_mapping={i: f"CH{i}" for i in range(1, n_o_ch + 1)},
         )
         """Current channel"""
 
@@ -304,7 +313,7 @@ class RigolDG5000Pro(VisaInstrument):
             "display_state",
             get_cmd=":DISPlay:STATe?",
             set_cmd=":DISPlay:STATe {:d}",
-            val_mapping=create_on_off_val_mapping(on_val=1, off_val=0),
+            val_mapping=_ON_OFF_01,
         )
         """State of the front-panel screen (on or off)"""
 
@@ -371,9 +380,42 @@ class RigolDG5000Pro(VisaInstrument):
         # :INITiate commands are used to set or query the "wait-for-trigger" state of the
         # instrument.
 
+    def add_parameter(
+            self,
+            name: str,
+            parameter_class: Optional[type] = None,
+            **kwargs: Any,
+    ) -> Any:
+        # Record plain-string SCPI commands like the channels do, so batched
+        # helpers cover the driver-level parameters as well. setdefault is
+        # needed because qcodes adds the IDN parameter during super().__init__,
+        # before this class's __init__ body runs.
+        if isinstance(kwargs.get("get_cmd"), str):
+            self.__dict__.setdefault("_scpi_get_cmds", {})[name] = kwargs["get_cmd"]
+        if isinstance(kwargs.get("set_cmd"), str):
+            self.__dict__.setdefault("_scpi_set_cmds", {})[name] = kwargs["set_cmd"]
+        return super().add_parameter(name, parameter_class, **kwargs)
+
+    def _batched_ask(self, cmds: list[str]) -> list[str]:
+        """
+        Sends multiple SCPI queries as a single compound command and splits the
+        response, replacing one VISA round-trip per query with a single one.
+
+        Each query must be an absolute header (leading ``:``) so the parser
+        path resets between the ``;``-separated commands.
+        """
+        replies = self.ask(";".join(cmds)).split(";")
+        if len(replies) != len(cmds):
+            # A short reply (e.g. a chain longer than the instrument's input
+            # buffer) would silently shift every later value onto the wrong
+            # query; refuse rather than return misaligned data.
+            raise RuntimeError(
+                f"Batched query returned {len(replies)} replies "
+                f"for {len(cmds)} queries")
+        return replies
+
     def all(self, state: Union[bool, str]) -> None:
-        val_mapping = create_on_off_val_mapping(on_val=1, off_val=0)
-        self.write(f":ALL {val_mapping[state]}")
+        self.write(f":ALL {_ON_OFF_01[state]}")
 
     def display_clear_text(self):
         """Clears the text message displayed on the front-panel screen"""
@@ -389,16 +431,26 @@ class RigolDG5000Pro(VisaInstrument):
         else:
             raise ValueError("Invalid file format (only .bmp or .png is supported)")
 
-        # Read screen capture from device
-        self.write(":HCOPy:SDUMp:DATA?")
-        bytestream = self.root_instrument.visa_handle.read_raw()
-        n = int(bytestream[1:2].decode("ascii"))
-        l = int(bytestream[2:2 + n].decode("ascii"))
-        img = bytestream[2 + n:].strip()
-
-        assert len(img) == l
-
+        # Read screen capture from device. The visa handle is looked up once,
+        # and the output file is opened before the transfer so the disk open
+        # is masked by the VISA read.
+        visa_handle = self.root_instrument.visa_handle
         with open(file=fname, mode="wb") as f:
+            self.write(":HCOPy:SDUMp:DATA?")
+            bytestream = visa_handle.read_raw()
+
+            # Parse the IEEE 488.2 block header (#NL...L) without decoding to
+            # str, and slice the payload to exactly the announced length
+            # instead of strip()-ing the whole image (which could also corrupt
+            # binary data ending in whitespace bytes).
+            n = bytestream[1] - 0x30
+            l = int(bytestream[2:2 + n])
+            # A memoryview slice avoids allocating a full-size copy of the
+            # image; file.write accepts any object supporting the buffer
+            # protocol.
+            img = memoryview(bytestream)[2 + n:2 + n + l]
+
+            assert len(img) == l
             f.write(img)
 
     # IEEE488.2 Common Commands
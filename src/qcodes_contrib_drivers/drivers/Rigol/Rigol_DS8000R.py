@@ -1,52 +1,146 @@
 import logging
-from typing import TYPE_CHECKING
+import time
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Any, Iterator, NamedTuple, Optional, Sequence, Union
 
 import numpy as np
 from qcodes.instrument import VisaInstrument, VisaInstrumentKWArgs, InstrumentChannel, InstrumentBaseKWArgs, Instrument
 from qcodes.parameters import Parameter, ParameterWithSetpoints, ParamRawDataType, create_on_off_val_mapping
-from qcodes.validators import Enum, Ints, Numbers, Arrays
+from qcodes.validators import Bool, Enum, Ints, Numbers, Arrays
 
 if TYPE_CHECKING:
     from typing_extensions import Unpack
 
 log = logging.getLogger(__name__)
 
+_CHUNK_POINTS = {"byte": 250_000, "word": 125_000}
+"""Maximum number of points transferred per :WAVeform:DATA? query"""
+
+_CHAN_SRC = ("CHAN1", "CHAN2", "CHAN3", "CHAN4")
+"""Pre-built waveform source names, indexed by ``channel - 1``"""
+
+_READ_CHUNK_BYTES = 1_048_576
+"""Upper bound on a single low-level VISA read when streaming payloads"""
+
+_CMD_WAV_DATA = b":WAVeform:DATA?\n"
+"""Pre-encoded data query for the hot transfer loop (terminator included)"""
+
+_PREAMBLE_SAFE_PREFIXES = (":WAVeform:DATA", ":WAVeform:STARt", ":WAVeform:STOP")
+"""Commands that leave the waveform scaling untouched and therefore do not
+invalidate the cached preamble (start/stop only move the read window)"""
+
+_WINDOW_SAFE_PREFIXES = _PREAMBLE_SAFE_PREFIXES + (
+    ":WAVeform:SOURce", ":WAVeform:FORMat")
+"""Commands that leave the :WAVeform points/start/stop settings in place.
+A superset of the preamble-safe ones: source and format changes rescale the
+data (and so drop the preamble) but do not move the read window. A mode
+change is deliberately absent — it switches between screen and memory
+geometry and resets the window with it."""
+
+
+def _to_01(v: bool) -> str:
+    """Formats a boolean as the '1'/'0' the scope expects"""
+    return "1" if v else "0"
+
+
+def _from_01(r: str) -> bool:
+    """Parses the scope's '1'/'0' (or 'ON'/'OFF') reply into a boolean"""
+    return r.strip() in ("1", "ON")
+
+
+def _fmt_num(v: float) -> str:
+    """Formats a float compactly for SCPI; '%.6g' beats '{:f}' per call and
+    keeps the command payload short"""
+    return format(v, ".6g")
+
+
+try:
+    import numba
+
+    @numba.njit(parallel=True, fastmath=True, cache=True)
+    def _codes_to_volts(codes, bias, yincrement, out):  # pragma: no cover
+        """ADC-code to volt conversion, fused into one parallel pass"""
+        for i in numba.prange(codes.size):
+            out[i] = (np.float32(codes[i]) - bias) * yincrement
+
+except ImportError:
+    def _codes_to_volts(codes, bias, yincrement, out):
+        """ADC-code to volt conversion (NumPy fallback without numba)"""
+        np.subtract(codes, bias, out=out, casting="unsafe")
+        out *= yincrement
+
+def _record_scpi_cmds(instrument: Instrument, name: str, kwargs: dict) -> None:
+    """
+    Records plain-string SCPI commands of a parameter so they can be replayed
+    in batched compound queries (see ``RigolDS8000R.snapshot_fast``).
+    """
+    if isinstance(kwargs.get("get_cmd"), str):
+        instrument.__dict__.setdefault("_scpi_get_cmds", {})[name] = kwargs["get_cmd"]
+    if isinstance(kwargs.get("set_cmd"), str):
+        instrument.__dict__.setdefault("_scpi_set_cmds", {})[name] = kwargs["set_cmd"]
+
+
+class ModelConfig(NamedTuple):
+    """Per-model configuration constants"""
+    n_channels: int
+    bw_limits: tuple[str, ...]
+
+
+_MODEL_TABLE: dict[str, ModelConfig] = {
+    "DS8104-R": ModelConfig(4, ("20M", "250M", "500M", "OFF")),
+    "DS8204-R": ModelConfig(4, ("20M", "250M", "500M", "OFF")),
+    "DS8034-R": ModelConfig(4, ("20M", "250M", "OFF")),
+}
+"""Channel count and supported bandwidth limits of each model"""
+
+
+class WaveformPreamble(NamedTuple):
+    """Parsed :WAVeform:PREamble? reply
+
+    ``averages`` is the preamble's <count> field (number of averages in the
+    average acquisition modes); it cannot be called ``count`` because that
+    would shadow ``tuple.count``.
+    """
+    format: str
+    type: str
+    points: int
+    averages: int
+    xincrement: float
+    xorigin: float
+    xreference: float
+    yincrement: float
+    yorigin: float
+    yreference: float
+
 
 class ParameterTimeAxis(Parameter):
 
     def get_raw(self):
         p = self.instrument.get_waveform_preamble()
-        return np.linspace(p["xorigin"], p["xorigin"] + p["xincrement"] * p["points"], p["points"])
+        # arange + scalar multiply-add yields exactly xorigin + k*xincrement
+        # per sample; linspace divides per element and lands on slightly
+        # different values since its endpoint is inclusive.
+        return p.xorigin + p.xincrement * np.arange(p.points, dtype=np.float64)
 
 
 class ScopeArrayRaw(Parameter):
     def get_raw(self) -> ParamRawDataType:
-
-        # Ensure STOP
-        if self.root_instrument.trigger_status() != "STOP":
-            raise RuntimeError("Waveform data can only be read when the oscilloscope is in the STOP state.")
-
-        # Ensure RAW
-        if self.root_instrument.waveform_mode() != 'raw':
+        root = self.root_instrument
+
+        # Ensure RAW. Mode and format are answered from the parameter caches
+        # when known (get_trace keeps them current), so repeated trace reads
+        # cost no extra round-trips; only the very first read queries.
+        mode = root.waveform_mode.cache.get(get_if_invalid=False)
+        if mode is None:
+            mode = root.waveform_mode()
+        if mode != 'raw':
             raise RuntimeError("Only raw mode is supported for now.")
 
-        # Waveform source
-        self.root_instrument.waveform_source(f"CHAN{self.instrument.channel}")
-
-        # Read data
-        self.root_instrument.write(":WAVeform:DATA?")
-        bytestream = self.root_instrument.visa_handle.read_raw()
-        n = int(bytestream[1:2].decode("ascii"))
-        l = int(bytestream[2:2 + n].decode("ascii"))
-        waveform = bytestream[2 + n:].strip()
+        fmt = root.waveform_format.cache.get(get_if_invalid=False)
+        if fmt is None:
+            fmt = root.waveform_format()
 
-        # Convert to ndarray
-        if self.root_instrument.waveform_format() == "byte":
-            waveform = np.frombuffer(waveform, dtype=np.uint8, count=l)
-        else:
-            waveform = np.frombuffer(waveform, dtype=np.uint16, count=l)
-
-        return waveform
+        return root.get_trace(self.instrument.channel, fmt=fmt)
 
 
 class ScopeArray(ParameterWithSetpoints):
@@ -54,13 +148,82 @@ class ScopeArray(ParameterWithSetpoints):
     def get_raw(self) -> ParamRawDataType:
         trace_raw = self.instrument.trace_raw()
 
-        # Covert from ADC values to Voltage
+        # Covert from ADC values to Voltage through the shared kernel: a
+        # single parallel pass with numba installed, two allocation-free
+        # float32 passes otherwise. Either way no temporaries and no
+        # float64 upcast on this memory-bound path.
         p = self.root_instrument.get_waveform_preamble()
-        return (trace_raw - p["yreference"] - p["yorigin"]) * p["yincrement"]
+        out = np.empty(trace_raw.shape, dtype=np.float32)
+        _codes_to_volts(trace_raw, np.float32(p.yreference + p.yorigin),
+                        np.float32(p.yincrement), out)
+        return out
 
 
 class RigolDS8000RChannel(InstrumentChannel):
 
+    _PARAM_SPECS: tuple[tuple[str, str, str, dict, Optional[str]], ...] = (
+        # (name, get_cmd template, set_cmd template, extra kwargs, docstring)
+        ("bandwidth_limit",
+         ":CHANnel{ch}:BWLimit?", ":CHANnel{ch}:BWLimit {{}}",
+         dict(),  # vals are model-specific, filled in __init__
+         "Bandwidth limit of the specified channel"),
+        ("coupling",
+         ":CHANnel{ch}:COUPling?", ":CHANnel{ch}:COUPling {{}}",
+         dict(vals=Enum("AC", "DC", "GND")),
+         "Coupling mode of the specified channel"),
+        ("display",
+         ":CHANnel{ch}:DISPlay?", ":CHANnel{ch}:DISPlay {{}}",
+         dict(set_parser=_to_01, get_parser=_from_01, vals=Bool()),
+         "Whether the specified channel is displayed or not"),
+        ("invert",
+         ":CHANnel{ch}:INVert?", ":CHANnel{ch}:INVert {{}}",
+         dict(set_parser=_to_01, get_parser=_from_01, vals=Bool()),
+         "Whether the specified channel is inverted or not"),
+        ("offset",
+         ":CHANnel{ch}:OFFSet?", ":CHANnel{ch}:OFFSet {{}}",
+         dict(unit="V", vals=Numbers(), get_parser=float, set_parser=_fmt_num),
+         "Vertical offset of the specified channel in (V)"),
+        ("delay_calibration_time",
+         ":CHANnel{ch}:TCALibrate?", ":CHANnel{ch}:TCALibrate {{}}",
+         dict(unit="s", vals=Numbers(-100e-9, 100e-9), get_parser=float),
+         "Delay calibration time (used to calibrate the zero offset of the corresponding channel) of the specified channel in (s)"),
+        ("scale",
+         ":CHANnel{ch}:SCAle?", ":CHANnel{ch}:SCALe {{}}",
+         dict(unit="V", vals=Numbers(1e-3, 10), get_parser=float, set_parser=_fmt_num),
+         "Vertical scale of the specified channel in (V)"),
+        ("impedance",
+         ":CHANnel{ch}:IMPedance?", ":CHANnel{ch}:IMPedance {{}}",
+         dict(val_mapping={"50 Ohm": "FIFT", "1 MOhm": "OMEG"}),
+         "Input impedance of the specified channel"),
+        ("probe",
+         ":CHANnel{ch}:PROBe?", ":CHANnel{ch}:PROBe {{}}",
+         dict(vals=Enum(0.0001, 0.0002, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5,
+                        1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000),
+              get_parser=float),
+         "Probe ratio of the specified channel"),
+        ("probe_delay",
+         ":CHANnel{ch}:PROBe:DELay?", ":CHANnel{ch}:PROBe:DELay {{}}",
+         dict(unit="s", vals=Numbers(-100e-9, 100e-9), get_parser=float),
+         "Probe delay time of the specified channel in (s)"),
+        ("probe_bias",
+         ":CHANnel{ch}:PROBe:BIAS?", ":CHANnel{ch}:PROBe:BIAS {{}}",
+         dict(unit="V", vals=Numbers(-5, 5), get_parser=float),
+         "Probe bias voltage of the specified channel in (V)"),
+        ("units",
+         ":CHANnel{ch}:UNITs?", ":CHANnel{ch}:UNITs {{}}",
+         dict(val_mapping={"volt": "VOLT", "watt": "WATT", "ampere": "AMP", "unknown": "UNKN"}),
+         "Amplitude display unit of the specified channel"),
+        ("vernier",
+         ":CHANnel{ch}:VERNier?", ":CHANnel{ch}:VERNier {{}}",
+         dict(set_parser=_to_01, get_parser=_from_01, vals=Bool()),
+         "On/off status of the fine adjustment function of the vertical scale of the specified channel"),
+        ("position",
+         ":CHANnel{ch}:POSition?", ":CHANnel{ch}:POSition {{}}",
+         dict(vals=Numbers(-100, 100), get_parser=float, set_parser=_fmt_num),
+         "Offset calibration voltage for calibrating the zero point of the specified channel in (V)"),
+    )
+    """SCPI-backed channel parameters, instantiated per channel in __init__"""
+
     def __init__(
             self,
             parent: Instrument,
@@ -71,136 +234,28 @@ class RigolDS8000RChannel(InstrumentChannel):
         super().__init__(parent, name, **kwargs)
         self.model = self._parent.model
         self.channel = channel
-
-        self.bandwidth_limit: Parameter = self.add_parameter(
-            "bandwidth_limit",
-            set_cmd=f":CHANnel{channel}:BWLimit {{}}",
-            get_cmd=f":CHANnel{channel}:BWLimit?",
-            vals=Enum("20M", "OFF"),
-        )
-        """Bandwidth limit of the specified channel"""
-
-        self.coupling: Parameter = self.add_parameter(
-            "coupling",
-            set_cmd=f":CHANnel{channel}:COUPling {{}}",
-            get_cmd=f":CHANnel{channel}:COUPling?",
-            vals=Enum("AC", "DC", "GND"),
-        )
-        """Coupling mode of the specified channel"""
-
-        self.display: Parameter = self.add_parameter(
-            "display",
-            set_cmd=f":CHANnel{channel}:DISPlay {{}}",
-            get_cmd=f":CHANnel{channel}:DISPlay?",
-            val_mapping=create_on_off_val_mapping(on_val=1, off_val=0)
-        )
-        """Whether the specified channel is displayed or not"""
-
-        self.invert: Parameter = self.add_parameter(
-            "invert",
-            set_cmd=f":CHANnel{channel}:INVert {{}}",
-            get_cmd=f":CHANnel{channel}:INVert?",
-            val_mapping=create_on_off_val_mapping(on_val=1, off_val=0)
-        )
-        """Whether the specified channel is inverted or not"""
-
-        self.offset: Parameter = self.add_parameter(
-            "offset",
-            unit="V",
-            set_cmd=f":CHANnel{channel}:OFFSet {{:f}}",
-            get_cmd=f":CHANnel{channel}:OFFSet?",
-            vals=Numbers(),
-            get_parser=float
-        )
-        """Vertical offset of the specified channel in (V)"""
-
-        self.delay_calibration_time: Parameter = self.add_parameter(
-            "delay_calibration_time",
-            unit="s",
-            set_cmd=f":CHANnel{channel}:TCALibrate {{}}",
-            get_cmd=f":CHANnel{channel}:TCALibrate?",
-            vals=Numbers(-100e-9, 100e-9),
-            get_parser=float
-        )
-        """Delay calibration time (used to calibrate the zero offset of the corresponding channel) of the specified channel in (s)"""
-
-        self.scale: Parameter = self.add_parameter(
-            "scale",
-            unit="V",
-            set_cmd=f":CHANnel{channel}:SCALe {{:f}}",
-            get_cmd=f":CHANnel{channel}:SCAle?",
-            vals=Numbers(1e-3, 10),
-            get_parser=float
-        )
-        """Vertical scale of the specified channel in (V)"""
-
-        self.impedance: Parameter = self.add_parameter(
-            "impedance",
-            set_cmd=f":CHANnel{channel}:IMPedance {{}}",
-            get_cmd=f":CHANnel{channel}:IMPedance?",
-            val_mapping={"50 Ohm": "FIFT", "1 MOhm": "OMEG"},
-        )
-        """Input impedance of the specified channel"""
-
-        self.probe: Parameter = self.add_parameter(
-            "probe",
-            set_cmd=f":CHANnel{channel}:PROBe {{}}",
-            get_cmd=f":CHANnel{channel}:PROBe?",
-            vals=Enum(0.0001, 0.0002, 0.0005, 0.001, 0.002, 0.005, 0.01, 0.02, 0.05, 0.1, 0.2, 0.5,
-                      1, 2, 5, 10, 20, 50, 100, 200, 500, 1000, 2000, 5000, 10000, 20000, 50000),
-            get_parser=float
-        )
-        """Probe ratio of the specified channel"""
-
-        self.probe_delay: Parameter = self.add_parameter(
-            "probe_delay",
-            unit="s",
-            set_cmd=f":CHANnel{channel}:PROBe:DELay {{}}",
-            get_cmd=f":CHANnel{channel}:PROBe:DELay?",
-            vals=Numbers(-100e-9, 100e-9),
-            get_parser=float
-        )
-        """Probe delay time of the specified channel in (s)"""
-
-        self.probe_bias: Parameter = self.add_parameter(
-            "probe_bias",
-            unit="V",
-            set_cmd=f":CHANnel{channel}:PROBe:BIAS {{}}",
-            get_cmd=f":CHANnel{channel}:PROBe:BIAS?",
-            vals=Numbers(-5, 5),
-            get_parser=float
-        )
-        """Probe bias voltage of the specified channel in (V)"""
-
-        self.units: Parameter = self.add_parameter(
-            "units",
-            set_cmd=f":CHANnel{channel}:UNITs {{}}",
-            get_cmd=f":CHANnel{channel}:UNITs?",
-            val_mapping={"volt": "VOLT", "watt": "WATT", "ampere": "AMP", "unknown": "UNKN"},
-        )
-        """Amplitude display unit of the specified channel"""
-
-        self.vernier: Parameter = self.add_parameter(
-            "vernier",
-            set_cmd=f":CHANnel{channel}:VERNier {{}}",
-            get_cmd=f":CHANnel{channel}:VERNier?",
-            val_mapping=create_on_off_val_mapping(1, 0)
-        )
-        """On/off status of the fine adjustment function of the vertical scale of the specified channel"""
-
-        self.position: Parameter = self.add_parameter(
-            "position",
-            set_cmd=f":CHANnel{channel}:POSition {{:f}}",
-            get_cmd=f":CHANnel{channel}:POSition?",
-            vals=Numbers(-100, 100),
-            get_parser=float
-        )
-        """Offset calibration voltage for calibrating the zero point of the specified channel in (V)"""
+        # Command strings reused in hot paths, built once per channel
+        self._src_name = f"CHAN{channel}"
+        self._cstart_cmd = f":CHANnel{channel}:CSTart"
+
+        for name, get_cmd, set_cmd, extra_kwargs, docstring in self._PARAM_SPECS:
+            if name == "bandwidth_limit":
+                # The allowed limits depend on the model (e.g. 250M/500M on
+                # the DS8104-R); the parent builds the shared validator once
+                # from _MODEL_TABLE.
+                extra_kwargs = dict(extra_kwargs, vals=self._parent._bw_limit_vals)
+            self.add_parameter(
+                name,
+                get_cmd=get_cmd.format(ch=channel),
+                set_cmd=set_cmd.format(ch=channel),
+                docstring=docstring,
+                **extra_kwargs,
+            )
 
         self.trace_raw: Parameter = self.add_parameter(
             "trace_raw",
             parameter_class=ScopeArrayRaw,
-            vals=Arrays(shape=(self.root_instrument.waveform_points.get,)),
+            vals=Arrays(shape=(self.root_instrument._points,)),
             snapshot_value=False
         )
         """Trace of the specified channel in ADC units"""
@@ -210,14 +265,19 @@ class RigolDS8000RChannel(InstrumentChannel):
             unit="V",
             parameter_class=ScopeArray,
             setpoints=(self.parent.timebase_axis,),
-            vals=Arrays(shape=(self.root_instrument.waveform_points.get,)),
+            vals=Arrays(shape=(self.root_instrument._points,)),
             snapshot_value=False
         )
         """Trace of the specified channel in (V)"""
 
+    def add_parameter(self, name: str, parameter_class: Optional[type] = None,
+                      **kwargs: Any) -> Any:
+        _record_scpi_cmds(self, name, kwargs)
+        return super().add_parameter(name, parameter_class, **kwargs)
+
     def calibrate(self) -> None:
         """Starts calibration of the active probe connected to the specified channel"""
-        self.write(f":CHANnel{self.channel}:CSTart")
+        self.write(self._cstart_cmd)
 
 
 class RigolDS8000R(VisaInstrument):
@@ -227,13 +287,15 @@ class RigolDS8000R(VisaInstrument):
 
     default_terminator = "\n"
 
-    MODELS = [
-        "DS8104-R",
-        "DS8204-R",
-        "DS8034-R",
-    ]
+    MODELS = list(_MODEL_TABLE)
     """Models part of the Rigol DS8000-R series of Oscilloscopes """
 
+    _preamble_cache: Optional[WaveformPreamble] = None
+    """Cached result of :WAVeform:PREamble?, dropped on every write"""
+
+    _trigger_state: Optional[str] = None
+    """Locally tracked trigger status, valid only while known to be STOP"""
+
     def __init__(
             self,
             name: str,
@@ -242,20 +304,21 @@ class RigolDS8000R(VisaInstrument):
     ):
         super().__init__(name, address, **kwargs)
 
+        # pyvisa's default chunk_size (20 kB) splits a single waveform read
+        # into many low-level reads; 1 MiB makes bulk transfers
+        # bandwidth-limited instead of syscall-limited.
+        self.visa_handle.chunk_size = max(self.visa_handle.chunk_size, 1_048_576)
+
         self.model = self.get_idn()["model"]
 
-        if self.model in self.MODELS:
-            i = self.MODELS.index(self.model)
-            self.n_o_ch = [4, 4, 4][i]
-            self.bw_limit = [
-                ('20M', '250M', '500M', 'OFF'),
-                ('20M', '250M', '500M', 'OFF'),
-                ('20M', '250M', 'OFF'),
-            ][i]
-        elif self.model is None:
-            raise KeyError("Could not determine model")
-        else:
-            raise KeyError("Model code " + self.model + " is not recognized")
+        cfg = _MODEL_TABLE.get(self.model)
+        if cfg is None:
+            raise KeyError(f"Model code {self.model} is not recognized")
+        self.n_o_ch = cfg.n_channels
+        self.bw_limit = cfg.bw_limits
+
+        self._bw_limit_vals = Enum(*self.bw_limit)
+        """Model-specific bandwidth-limit validator, shared by all channels"""
 
         self.acquire_averages = self.add_parameter(
             "acquire_averages",
@@ -308,7 +371,9 @@ class RigolDS8000R(VisaInstrument):
             "timebase_delay_enable",
             set_cmd=f":TIMebase:DELay:ENABle {{}}",
             get_cmd=f":TIMebase:DELay:ENABLe?",
-            val_mapping=create_on_off_val_mapping(1, 0),
+            set_parser=_to_01,
+            get_parser=_from_01,
+            vals=Bool(),
         )
         """On/off status of the delayed sweep"""
 
@@ -387,7 +452,9 @@ class RigolDS8000R(VisaInstrument):
             "timebase_vernier",
             set_cmd=f":TIMebase:VERNier {{}}",
             get_cmd=f":TIMebase:VERNier?",
-            val_mapping=create_on_off_val_mapping(1, 0),
+            set_parser=_to_01,
+            get_parser=_from_01,
+            vals=Bool(),
         )
         """On/off status of the fine adjustment function of the horizontal scale"""
 
@@ -587,7 +654,11 @@ class RigolDS8000R(VisaInstrument):
             get_cmd=f":WAVeform:FORMat?",
             val_mapping={"word": "WORD", "byte": "BYTE", "ascii": "ASC"},
         )
-        """Return format of the waveform data points to be read"""
+        """Return format of the waveform data points to be read.
+
+        "word" carries the full ADC resolution; "byte" keeps only the upper
+        8 bits but halves the transfer size, which matters at deep memory
+        depths."""
 
         self.waveform_points: Parameter = self.add_parameter(
             "waveform_points",
@@ -620,7 +691,7 @@ class RigolDS8000R(VisaInstrument):
             "timebase_axis",
             unit="s",
             parameter_class=ParameterTimeAxis,
-            vals=Arrays(shape=(self.waveform_points.get,)),
+            vals=Arrays(shape=(self._points,)),
             snapshot_value=False
         )
         """Array of values corresponding to the time axes (w.r.t to trigger point)"""
@@ -632,31 +703,450 @@ class RigolDS8000R(VisaInstrument):
             channel = RigolDS8000RChannel(self, f"ch{i}", i)
             self.ch += [self.add_submodule(f"ch{i}", channel)]
 
+    def _points(self) -> int:
+        """
+        Number of waveform points, served from the parameter cache when one
+        is known.
+
+        Used as the shape callable of the array validators: validating a
+        trace against ``waveform_points.get`` would cost one
+        :WAVeform:POINts? round-trip per validation — several per fetched
+        trace once setpoints are included.
+        """
+        cache = self.waveform_points.cache
+        # An invalidated cache still hands out its stale value via
+        # get(get_if_invalid=False), so check validity explicitly.
+        if cache.valid:
+            return cache.get(get_if_invalid=False)
+        return self.waveform_points()
+
     def trigger_status(self):
-        """Queries the current trigger status"""
+        """Queries the current trigger status
+
+        After a :meth:`stop` the status is tracked locally, so acquisition
+        loops that read many traces from a stopped scope skip the
+        :TRIGger:STATus? round-trip. Any command that can restart the
+        acquisition drops the local state and falls back to querying.
+        """
+        if self._trigger_state is not None:
+            return self._trigger_state
         return self.ask(":TRIGger:STATus?")
 
-    def get_waveform_preamble(self):
-        """Returns 10 waveform parameters seperated by comma"""
-        preample = self.ask(":WAVeform:PREamble?")
-        preample = preample.split(",")
-        preample_dict = {
-            "format": ["BYTE", "WORD", "ASC"][int(preample[0])],
-            "type": ["NORM", "MAX", "RAW"][int(preample[1])],
-            "points": int(preample[2]),
-            "count": int(preample[3]),
-            "xincrement": float(preample[4]),
-            "xorigin": float(preample[5]),
-            "xreference": float(preample[6]),
-            "yincrement": float(preample[7]),
-            "yorigin": float(preample[8]),
-            "yreference": float(preample[9]),
-        }
-        return preample_dict
+    def get_trace(self, source: Union[int, str], fmt: Optional[str] = None,
+                  pts: Optional[int] = None, start: int = 1) -> np.ndarray:
+        """
+        Reads a waveform from the internal memory in chunks.
+
+        The scope caps a single :WAVeform:DATA? transfer at roughly 250 kpts,
+        so the requested range is read chunk by chunk via
+        :WAVeform:STARt/:STOP and assembled into one preallocated array.
+
+        The payload is sliced to exactly the length announced in the IEEE
+        488.2 block header; binary data must never be strip()-ed since valid
+        samples can end in whitespace byte values.
+
+        Args:
+            source: Channel number (1-4) or waveform source name (e.g. "MATH1").
+            fmt: Transfer format, "word" (full ADC resolution) or "byte"
+                (8 bit, half the bytes on the wire). The default None picks
+                "byte" for reads of 1 Mpt and more, "word" otherwise.
+            pts: Number of points to read; defaults to the currently
+                configured number of waveform points.
+            start: First memory position to read (1-based). Together with
+                ``pts`` this reads an arbitrary window of the memory depth,
+                so a small region of a 500 Mpt capture costs only its own
+                transfer time.
+
+        Returns:
+            Raw ADC codes as uint8 ("byte") or uint16 ("word"). When the
+            request fits in a single transfer this is a read-only zero-copy
+            view of the reply buffer — ``.copy()`` it to get a writable
+            array; reductions (mean, FFT, ...) can consume it as is.
+        """
+        # Ensure STOP
+        if self.trigger_status() != "STOP":
+            raise RuntimeError("Waveform data can only be read when the oscilloscope is in the STOP state.")
+
+        pts_is_configured_depth = pts is None
+        if pts is None:
+            pts = self.waveform_points()
+        if fmt is None:
+            # At deep memory depths the transfer itself dominates; trade the
+            # lower 8 bits of resolution for half the bytes on the wire.
+            fmt = "byte" if pts >= 1_000_000 else "word"
+        elif fmt not in _CHUNK_POINTS:
+            # Reject before any instrument state is touched; "ascii" is a
+            # valid waveform_format but has no binary block to parse here.
+            raise ValueError(
+                f"fmt must be one of {sorted(_CHUNK_POINTS)}, not {fmt!r}; "
+                "only binary transfers are supported by get_trace")
+
+        src = _CHAN_SRC[source - 1] if isinstance(source, int) else source
+        fmt_raw = "BYTE" if fmt == "byte" else "WORD"
+        # One compound write for the whole setup instead of one round-trip
+        # per setting; the parameter caches are updated to match. The MODE
+        # part only rides along while the mode is not yet known to be raw:
+        # a mode change resets the read window, so writing it every call
+        # would invalidate the start/stop caches and defeat the redundant-
+        # setter skip in _read_chunks.
+        mode_cache = self.waveform_mode.cache
+        setup = [f":WAVeform:SOURce {src}"]
+        if not (mode_cache.valid
+                and mode_cache.get(get_if_invalid=False) == "raw"):
+            setup.append(":WAVeform:MODE RAW")
+        setup.append(f":WAVeform:FORMat {fmt_raw}")
+        self.write(";".join(setup))
+        self.waveform_source.cache.set(src)
+        mode_cache.set("raw")
+        self.waveform_format.cache.set(fmt)
+        if pts_is_configured_depth:
+            # The setup write may have invalidated the points cache, but it
+            # does not touch :WAVeform:POINts, so the value queried above is
+            # still current. A caller-supplied window size must never end up
+            # in the cache — it describes this read, not the configured depth.
+            self.waveform_points.cache.set(pts)
+
+        # The scope sends 16-bit samples little-endian; spell that out so the
+        # buffer is interpreted correctly on big-endian hosts as well.
+        dtype = np.dtype(np.uint8 if fmt == "byte" else "<u2")
+        chunk = _CHUNK_POINTS[fmt]
+        # np.frombuffer on bytes is a zero-copy read-only view, so a
+        # single-transfer request needs no destination array at all.
+        out: Optional[np.ndarray] = None
+        out_mv: Optional[memoryview] = None
+        if pts > chunk:
+            out = np.empty(pts, dtype=dtype)
+            out_mv = out.data.cast("B")
+        visa_handle = self.visa_handle
+
+        # Make sure the timeout covers a whole chunk at a conservative
+        # 2 MB/s; the configured timeout is restored afterwards.
+        old_timeout = visa_handle.timeout
+        needed_ms = min(pts, chunk) * dtype.itemsize // 2_000
+        if needed_ms > old_timeout:
+            visa_handle.timeout = needed_ms
+        try:
+            return self._read_chunks(pts, chunk, dtype, out, out_mv, start)
+        finally:
+            visa_handle.timeout = old_timeout
+
+    def _read_chunks(self, pts: int, chunk: int, dtype: np.dtype,
+                     out: Optional[np.ndarray], out_mv: Optional[memoryview],
+                     start: int) -> np.ndarray:
+        """Transfer loop of :meth:`get_trace`; runs under its scaled timeout"""
+        visa_handle = self.visa_handle
+        for off in range(0, pts, chunk):
+            this = min(chunk, pts - off)
+            # Each command costs a round-trip; window setters whose value is
+            # already in place (e.g. repeated reads of the same window) are
+            # skipped and the rest ride along with the data query.
+            parts = []
+            first = start + off
+            last = first + this - 1
+            start_cache = self.waveform_start.cache
+            stop_cache = self.waveform_stop.cache
+            # Skip only on a *valid* cache hit: an invalidated cache (e.g.
+            # after *RST restored the default window) still returns its
+            # stale value from get(get_if_invalid=False).
+            if not (start_cache.valid
+                    and start_cache.get(get_if_invalid=False) == first):
+                parts.append(f":WAVeform:STARt {first}")
+                start_cache.set(first)
+            if not (stop_cache.valid
+                    and stop_cache.get(get_if_invalid=False) == last):
+                parts.append(f":WAVeform:STOP {last}")
+                stop_cache.set(last)
+            if parts:
+                parts.append(":WAVeform:DATA?")
+                self.write(";".join(parts))
+            else:
+                # Repeated same-window reads boil down to the bare data
+                # query; the pre-encoded bytes skip pyvisa's per-call encode.
+                visa_handle.write_raw(_CMD_WAV_DATA)
+            # '#Nxxx...' block header; the digit count is a single ASCII byte.
+            # The header announces the payload length, so request exact byte
+            # counts instead of read_raw()'s scan for the END indicator.
+            hdr = visa_handle.read_bytes(2)
+            n = hdr[1] - 0x30
+            payload_len = int(visa_handle.read_bytes(n))
+            if out is None:
+                payload = visa_handle.read_bytes(payload_len)
+                visa_handle.read_bytes(1)  # trailing LF
+                return np.frombuffer(payload, dtype=dtype, count=this)
+            # Stream the payload straight into the destination buffer in
+            # bounded pieces; no intermediate full-chunk bytes object.
+            assert out_mv is not None
+            pos = off * dtype.itemsize
+            end = pos + payload_len
+            while pos < end:
+                piece = visa_handle.read_bytes(min(_READ_CHUNK_BYTES, end - pos))
+                out_mv[pos:pos + len(piece)] = piece
+                pos += len(piece)
+            visa_handle.read_bytes(1)  # trailing LF
+
+        # Multi-chunk requests always allocate the destination array; the
+        # single-transfer case returned from inside the loop.
+        assert out is not None
+        return out
+
+    @contextmanager
+    def acquisition_session(self) -> Iterator[None]:
+        """
+        Stops the scope for a block of trace reads.
+
+        Within the block the trigger state is known to be STOP, so every
+        get_trace/trace fetch skips its :TRIGger:STATus? round-trip — one
+        saved round-trip per trace when reading all channels of a stopped
+        acquisition. On exit the locally tracked state is dropped; the scope
+        stays stopped until :meth:`run` or :meth:`single` is called.
+        """
+        self.stop()
+        try:
+            yield
+        finally:
+            self._trigger_state = None
+
+    def get_all_traces(self, channels: Optional[Sequence[int]] = None,
+                       fmt: str = "word") -> dict[int, np.ndarray]:
+        """
+        Reads the traces of several channels back-to-back with pipelined
+        queries.
+
+        The next channel's source select and data query are written as soon
+        as the previous payload has arrived, before that payload is parsed,
+        so the instrument prepares transfer N+1 while the host decodes
+        transfer N. A true asynchronous read (viReadAsync) is not reachable
+        through qcodes' synchronous VisaInstrument API, so the overlap happens
+        at the command level instead.
+
+        Each channel is read with a single :WAVeform:DATA? covering the
+        currently configured waveform window; for windows beyond the
+        per-transfer cap use :meth:`get_trace` per channel.
+
+        Args:
+            channels: Channel numbers to read; defaults to all channels.
+            fmt: Transfer format, "word" (default) or "byte".
+
+        Returns:
+            Mapping of channel number to raw ADC codes. The arrays are
+            read-only zero-copy views of the reply buffers; ``.copy()`` one
+            to get a writable array.
+        """
+        if fmt not in _CHUNK_POINTS:
+            raise ValueError(
+                f"fmt must be one of {sorted(_CHUNK_POINTS)}, not {fmt!r}; "
+                "only binary transfers are supported by get_all_traces")
+
+        # Ensure STOP
+        if self.trigger_status() != "STOP":
+            raise RuntimeError("Waveform data can only be read when the oscilloscope is in the STOP state.")
+
+        chans = list(channels) if channels is not None else list(range(1, self.n_o_ch + 1))
+        if not chans:
+            return {}
+
+        self.waveform_mode("raw")
+        self.waveform_format(fmt)
+        dtype = np.dtype(np.uint8 if fmt == "byte" else "<u2")
+        visa_handle = self.visa_handle
+
+        traces: dict[int, np.ndarray] = {}
+        self.write(f":WAVeform:SOURce {_CHAN_SRC[chans[0] - 1]};:WAVeform:DATA?")
+        for i, ch in enumerate(chans):
+            # Exact-count reads as in _read_chunks: read_raw() honours the
+            # termchar, and any 0x0A byte inside a binary payload would
+            # truncate the block mid-transfer.
+            hdr = visa_handle.read_bytes(2)
+            n = hdr[1] - 0x30
+            payload_len = int(visa_handle.read_bytes(n))
+            payload = visa_handle.read_bytes(payload_len)
+            visa_handle.read_bytes(1)  # trailing LF
+            if i + 1 < len(chans):
+                # Put the next query on the wire before parsing this payload
+                self.write(f":WAVeform:SOURce {_CHAN_SRC[chans[i + 1] - 1]};:WAVeform:DATA?")
+            traces[ch] = np.frombuffer(payload, dtype=dtype,
+                                       count=payload_len // dtype.itemsize)
+
+        return traces
+
+    def get_all_traces_volts(self, channels: Optional[Sequence[int]] = None,
+                             fmt: str = "word") -> dict[int, np.ndarray]:
+        """
+        Reads several channels with :meth:`get_all_traces` and converts all
+        of them to volts with one shared :WAVeform:PREamble? query instead
+        of one per trace.
+
+        The shared conversion constants assume identical vertical settings
+        on all requested channels; with per-channel scales use
+        :meth:`get_trace_volts` per channel instead.
+
+        Args:
+            channels: Channel numbers to read; defaults to all channels.
+            fmt: Transfer format, "word" (default) or "byte".
+
+        Returns:
+            Mapping of channel number to the trace in (V) as float32.
+        """
+        traces = self.get_all_traces(channels, fmt=fmt)
+        p = self.get_waveform_preamble()
+        bias = np.float32(p.yorigin + p.yreference)
+        yincrement = np.float32(p.yincrement)
+        volts: dict[int, np.ndarray] = {}
+        for ch, codes in traces.items():
+            out: np.ndarray = np.empty(codes.size, dtype=np.float32)
+            _codes_to_volts(codes, bias, yincrement, out)
+            volts[ch] = out
+        return volts
+
+    def stream_traces(self, n_shots: int, channel: int = 1,
+                      fmt: str = "word") -> Iterator[np.ndarray]:
+        """
+        Yields ``n_shots`` single-shot traces of a channel.
+
+        After each trace has been read out, the scope is re-armed with
+        :SINGle *before* the trace is yielded, so the instrument digitizes
+        shot N+1 while the caller processes shot N. This exploits the
+        scope's dead time without asynchronous reads, which neither qcodes'
+        synchronous API nor the pyvisa-py backend provide.
+
+        Args:
+            n_shots: Number of single-shot acquisitions to perform.
+            channel: Channel number to read.
+            fmt: Transfer format, "word" (default) or "byte".
+
+        Yields:
+            Raw ADC codes of each shot.
+        """
+        self.single()
+        for shot in range(n_shots):
+            while self.ask(":TRIGger:STATus?") != "STOP":
+                time.sleep(1e-3)
+            self._trigger_state = "STOP"
+            trace = self.get_trace(channel, fmt=fmt)
+            if shot + 1 < n_shots:
+                # Re-arm before handing the trace to the caller so the next
+                # shot is acquired while this one is being processed.
+                self.single()
+            yield trace
+
+    def get_trace_volts(self, source: Union[int, str], fmt: Optional[str] = None,
+                        pts: Optional[int] = None, start: int = 1) -> np.ndarray:
+        """
+        Reads a waveform and converts the raw ADC codes to voltage.
+
+        The conversion ``(codes - yorigin - yreference) * yincrement`` runs
+        as a single float32 pass over a preallocated output; float64
+        intermediates would double the memory traffic for no gain in
+        accuracy on 8/16-bit samples. With numba installed the pass is
+        JIT-compiled and parallelized, which pays off at the scope's
+        500 Mpt memory depths; without it a NumPy fallback is used.
+
+        Args:
+            source: Channel number (1-4) or waveform source name (e.g. "MATH1").
+            fmt: Transfer format; see :meth:`get_trace`.
+            pts: Number of points to read; defaults to the currently
+                configured number of waveform points.
+            start: First memory position to read (1-based).
+
+        Returns:
+            The trace in (V) as a float32 ndarray.
+        """
+        # Fetch the preamble only after get_trace has switched source and
+        # format: those writes drop the preamble cache, and scaling constants
+        # read before them would describe the previous source/format.
+        codes = self.get_trace(source, fmt=fmt, pts=pts, start=start)
+        p = self.get_waveform_preamble()
+        bias = np.float32(p.yorigin + p.yreference)
+        out: np.ndarray = np.empty(codes.size, dtype=np.float32)
+        _codes_to_volts(codes, bias, np.float32(p.yincrement), out)
+        return out
+
+    def write(self, cmd: str) -> None:
+        # A state-changing command may alter the acquisition geometry, so
+        # drop the cached waveform preamble — unless every command in the
+        # (possibly compound) write is known to leave the scaling alone, as
+        # is the case for the per-chunk commands of get_trace.
+        parts = cmd.split(";")
+        if not all(part.startswith(_PREAMBLE_SAFE_PREFIXES) for part in parts):
+            self._preamble_cache = None
+        # The window settings survive the larger set of :WAVeform commands
+        # (source/format selection included) so that get_trace's setup write
+        # keeps the start/stop caches and repeated same-window reads can
+        # skip their setters. Anything else may have changed the geometry;
+        # stale points/start/stop caches would let the array validators pass
+        # wrong shapes or make _read_chunks skip its window setters.
+        if not all(part.startswith(_WINDOW_SAFE_PREFIXES) for part in parts):
+            if "waveform_stop" in self.parameters:
+                self.waveform_points.cache.invalidate()
+                self.waveform_start.cache.invalidate()
+                self.waveform_stop.cache.invalidate()
+        super().write(cmd)
+
+    def add_parameter(self, name: str, parameter_class: Optional[type] = None,
+                      **kwargs: Any) -> Any:
+        _record_scpi_cmds(self, name, kwargs)
+        return super().add_parameter(name, parameter_class, **kwargs)
+
+    def snapshot_fast(self) -> dict:
+        """
+        Refreshes the caches of all SCPI-backed parameters (instrument and
+        channels) with one compound query per module and returns a snapshot
+        without further instrument I/O.
+
+        A regular ``snapshot(update=True)`` costs one VISA round-trip per
+        parameter (~60 on a 4-channel scope); here the recorded getters are
+        joined with ';' into a single ask per module. Not every SCPI stack
+        accepts arbitrary command chaining, which is why this is offered as a
+        separate method instead of replacing the default snapshot path.
+        """
+        for module in (self, *self.submodules.values()):
+            cmds = getattr(module, "_scpi_get_cmds", None)
+            if not cmds:
+                continue
+            names = list(cmds)
+            replies = self.ask(";".join(cmds[name] for name in names)).split(";")
+            if len(replies) != len(names):
+                # A short reply (e.g. a chain longer than the instrument's
+                # input buffer) would silently shift every later value onto
+                # the wrong parameter; refuse rather than corrupt the caches.
+                raise RuntimeError(
+                    f"Batched query for {module.name} returned "
+                    f"{len(replies)} replies for {len(names)} queries")
+            for name, raw in zip(names, replies):
+                module.parameters[name].cache._set_from_raw_value(raw)
+        return self.snapshot(update=False)
+
+    def get_waveform_preamble(self) -> WaveformPreamble:
+        """Returns the 10 waveform parameters as a named tuple
+
+        The result is cached until the next command that can change the
+        waveform scaling, so acquisition loops pay the :WAVeform:PREamble?
+        round-trip only once. Window moves via :WAVeform:STARt/:STOP keep
+        the cache; only its ``points`` field may lag behind them.
+        """
+        if self._preamble_cache is not None:
+            return self._preamble_cache
+        fmt, typ, pnts, cnt, xi, xo, xr, yi, yo, yr = \
+            self.ask(":WAVeform:PREamble?").split(",")
+        preamble = WaveformPreamble(
+            format=["BYTE", "WORD", "ASC"][int(fmt)],
+            type=["NORM", "MAX", "RAW"][int(typ)],
+            points=int(pnts),
+            averages=int(cnt),
+            xincrement=float(xi),
+            xorigin=float(xo),
+            xreference=float(xr),
+            yincrement=float(yi),
+            yorigin=float(yo),
+            yreference=float(yr),
+        )
+        self._preamble_cache = preamble
+        return preamble
 
     def autoscale(self) -> None:
         """Enables the waveform auto setting function"""
         self.write(":AUToscale")
+        self._trigger_state = None
 
     def clear(self) -> None:
         """Clears all the waveforms on the screen"""
@@ -665,19 +1155,24 @@ class RigolDS8000R(VisaInstrument):
     def run(self) -> None:
         """Start the oscilloscope"""
         self.write(":RUN")
+        self._trigger_state = None
 
     def stop(self) -> None:
         """Stop the oscilloscope"""
         self.write(":STOP")
+        self._trigger_state = "STOP"
 
     def single(self) -> None:
         """Sets the trigger mode of the oscilloscope to 'Single' """
         self.write(":SINGle")
+        self._trigger_state = None
 
     def trigger_force(self) -> None:
         """Generates a trigger signal forcibly"""
         self.write(":TFORce")
+        self._trigger_state = None
 
     def reset(self):
         """Resets the instrument to its factory default settings"""
         self.write("*RST")
+        self._trigger_state = None
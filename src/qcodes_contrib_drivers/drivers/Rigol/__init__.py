@@ -4,8 +4,8 @@ from .Rigol_DP932 import RigolDP932E
 from .Rigol_DSG3136B import RigolDSG3136B
 
 __all__ = [
-    RigolDS8000R,
-    RigolDG5000Pro,
-    RigolDP932E,
-    RigolDP932E,
+    "RigolDS8000R",
+    "RigolDG5000Pro",
+    "RigolDP932E",
+    "RigolDSG3136B",
 ]